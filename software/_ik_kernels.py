@@ -0,0 +1,249 @@
+"""
+Numba-compiled kinematics kernels.
+
+Scalar IK/FK math extracted from kinematics.py into free functions so the
+hot path runs without CPython interpreter or NumPy ufunc-dispatch overhead.
+Falls back to plain Python if numba is not installed.
+
+Kernels are compiled (and warmed) at import time rather than cached on
+disk: this module is imported both flat (script use from software/) and as
+software._ik_kernels, and numba's cache pickles the defining module name,
+so an on-disk cache written under one name fails to load under the other.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    print("Warning: numba not installed. Run: pip install numba "
+          "(IK kernels will run without JIT compilation)")
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is unavailable"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+_D2R = math.pi / 180.0
+_R2D = 180.0 / math.pi
+
+
+@njit(fastmath=True)
+def _fk_geom(sp, sr, sy, e, w, l1, l2, l3):
+    """
+    Forward kinematics for the simplified 5-DOF arm model.
+
+    Args:
+        sp, sr, sy, e, w: Joint angles in radians
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+
+    Returns:
+        (x, y, z) end-effector position in meters
+    """
+    c_sp = math.cos(sp)
+    c_sre = math.cos(sr + e)
+    l23 = l2 + l3
+
+    horizontal_reach = l1 * math.cos(sr) * c_sp + l23 * c_sre * c_sp
+    height = l1 * math.sin(sr) + l23 * math.sin(sr + e)
+
+    x = horizontal_reach * math.cos(sy)
+    y = horizontal_reach * math.sin(sy)
+    z = height
+
+    return (x, y, z)
+
+
+@njit(fastmath=True)
+def _solve_core(tx, ty, tz, l1, l2_eff, sign):
+    """
+    2-link geometric decomposition shared by the positional and
+    oriented solvers.
+
+    Args:
+        tx, ty, tz: Target position in meters (already adjusted by caller)
+        l1: Upper arm length in meters
+        l2_eff: Effective second-link length in meters
+        sign: +1.0 for left arm, -1.0 for right arm (mirrors shoulder yaw)
+
+    Returns:
+        (shoulder_pitch, shoulder_roll, shoulder_yaw, elbow, wrist, ok)
+        Angles in degrees; ok is False if the target is unreachable.
+    """
+    # Solve shoulder yaw (rotation in horizontal plane)
+    shoulder_yaw = sign * math.atan2(ty, tx) * _R2D
+
+    # Target in arm's local 2D plane - compare squared distances so the
+    # unreachable fast-path skips the sqrt entirely
+    hd_sq = tx * tx + ty * ty
+    r_sq = hd_sq + tz * tz
+
+    l_sum = l1 + l2_eff
+    l_diff = l1 - l2_eff
+    if r_sq > l_sum * l_sum or r_sq < l_diff * l_diff:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, False)
+
+    horizontal_dist = math.sqrt(hd_sq)
+    r = math.sqrt(r_sq)
+
+    # Law of cosines for elbow angle (manual clamp for numerical stability)
+    cos_elbow = (l1 * l1 + l2_eff * l2_eff - r_sq) / (2.0 * l1 * l2_eff)
+    if cos_elbow < -1.0:
+        cos_elbow = -1.0
+    elif cos_elbow > 1.0:
+        cos_elbow = 1.0
+    elbow_angle = math.acos(cos_elbow) * _R2D
+
+    # Calculate shoulder angles - clamp the acos argument, which can
+    # drift past +/-1 on the reach boundary and would otherwise yield
+    # a NaN shoulder_roll silently
+    cos_beta = (l1 * l1 + r_sq - l2_eff * l2_eff) / (2.0 * l1 * r)
+    if cos_beta < -1.0:
+        cos_beta = -1.0
+    elif cos_beta > 1.0:
+        cos_beta = 1.0
+    alpha = math.atan2(tz, horizontal_dist)
+    beta = math.acos(cos_beta)
+
+    shoulder_roll = (alpha + beta) * _R2D
+    shoulder_pitch = 0.0  # Simplified - can be adjusted for orientation
+    wrist_rotation = 0.0  # Simplified - keep hand level
+
+    return (shoulder_pitch, shoulder_roll, shoulder_yaw,
+            elbow_angle, wrist_rotation, True)
+
+
+@njit(fastmath=True)
+def _solve_ik_geom(tx, ty, tz, l1, l2, l3, sign):
+    """
+    Geometric IK for the simplified 5-DOF arm.
+
+    Args:
+        tx, ty, tz: Target position in meters
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+        sign: +1.0 for left arm, -1.0 for right arm (mirrors shoulder yaw)
+
+    Returns:
+        Same tuple as _solve_core.
+    """
+    # Simplify to 2-link arm (upper + forearm+hand)
+    return _solve_core(tx, ty, tz, l1, l2 + l3, sign)
+
+
+@njit(fastmath=True)
+def _solve_ik_oriented(tx, ty, tz, approach_rad, l1, l2, l3, sign):
+    """
+    Geometric IK for a target with a desired approach angle.
+
+    Shifts the target back along the approach direction to the wrist
+    point, so the hand length is excluded from the 2-link chain
+    (the second link is the forearm alone).
+
+    Args:
+        tx, ty, tz: Fingertip target position in meters
+        approach_rad: Desired approach angle in radians (0 = horizontal)
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+        sign: +1.0 for left arm, -1.0 for right arm
+
+    Returns:
+        Same tuple as _solve_core (wrist is left at 0; caller sets it).
+    """
+    dx = tx - l3 * math.cos(approach_rad)
+    dz = tz - l3 * math.sin(approach_rad)
+    return _solve_core(dx, ty, dz, l1, l2, sign)
+
+
+@njit(fastmath=True)
+def _fk_error_sq(sp, sr, sy, e, w, tx, ty, tz, l1, l2, l3):
+    """
+    Squared distance between FK(angles) and a target position.
+
+    Fuses the FK evaluation with the error computation so the
+    intermediate position never leaves registers.
+
+    Args:
+        sp, sr, sy, e, w: Joint angles in radians
+        tx, ty, tz: Target position in meters
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+
+    Returns:
+        Squared 3D position error in square meters
+    """
+    x, y, z = _fk_geom(sp, sr, sy, e, w, l1, l2, l3)
+    dx = x - tx
+    dy = y - ty
+    dz = z - tz
+    return dx * dx + dy * dy + dz * dz
+
+
+@njit(parallel=True, fastmath=True)
+def _solve_ik_batch(targets, out, ok, l1, l2, l3, sign):
+    """
+    Solve IK for a batch of targets in parallel.
+
+    Args:
+        targets: (N, 3) float64 array of target positions in meters
+        out: (N, 5) float64 output array of joint angles in degrees
+        ok: (N,) bool output array, False where unreachable
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+        sign: +1.0 for left arm, -1.0 for right arm
+    """
+    l2_eff = l2 + l3
+    for i in prange(targets.shape[0]):
+        sp, sr, sy, el, wr, good = _solve_core(
+            targets[i, 0], targets[i, 1], targets[i, 2], l1, l2_eff, sign)
+        out[i, 0] = sp
+        out[i, 1] = sr
+        out[i, 2] = sy
+        out[i, 3] = el
+        out[i, 4] = wr
+        ok[i] = good
+
+
+def make_specialized_kernels(l1, l2, l3):
+    """
+    Build IK/FK closures with the link lengths baked in as constants.
+
+    A robot runs one ArmConfiguration for its whole lifetime, so the JIT
+    can constant-fold the length arithmetic instead of receiving the
+    values as arguments on every call.
+
+    Args:
+        l1, l2, l3: Upper arm, forearm, hand lengths in meters
+
+    Returns:
+        (solve, solve_oriented, fk) - solve(tx, ty, tz, sign),
+        solve_oriented(tx, ty, tz, approach_rad, sign) and
+        fk(sp, sr, sy, e, w)
+    """
+    @njit(fastmath=True)
+    def solve(tx, ty, tz, sign):
+        return _solve_ik_geom(tx, ty, tz, l1, l2, l3, sign)
+
+    @njit(fastmath=True)
+    def solve_oriented(tx, ty, tz, approach_rad, sign):
+        return _solve_ik_oriented(tx, ty, tz, approach_rad, l1, l2, l3, sign)
+
+    @njit(fastmath=True)
+    def fk(sp, sr, sy, e, w):
+        return _fk_geom(sp, sr, sy, e, w, l1, l2, l3)
+
+    return solve, solve_oriented, fk
+
+
+# Precompile at import so the first real call doesn't pay compile time
+_fk_geom(0.0, 0.0, 0.0, 0.0, 0.0, 0.25, 0.20, 0.10)
+_solve_ik_geom(0.2, 0.0, 0.1, 0.25, 0.20, 0.10, 1.0)
+_solve_ik_oriented(0.2, 0.0, 0.1, 0.0, 0.25, 0.20, 0.10, 1.0)
+_fk_error_sq(0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.0, 0.1, 0.25, 0.20, 0.10)
+_solve_ik_batch(np.zeros((1, 3)), np.zeros((1, 5)), np.zeros(1, np.bool_),
+                0.25, 0.20, 0.10, 1.0)
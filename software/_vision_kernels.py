@@ -0,0 +1,144 @@
+"""
+Numba-compiled vision kernels.
+
+Single-pass corner detection extracted from vision.py so the fabric
+search does one compiled image traversal instead of a chain of OpenCV
+full-image passes. Falls back to plain Python if numba is not
+installed - callers should check HAVE_NUMBA and keep their OpenCV path
+in that case, since the pure-Python fallback is far too slow for full
+frames.
+
+Compiled and warmed at import rather than disk-cached: the module is
+imported both flat and as software._vision_kernels, and numba's cache
+is keyed to one module name.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    print("Warning: numba not installed. Run: pip install numba "
+          "(vision kernels will run without JIT compilation)")
+
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is unavailable"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(parallel=True, fastmath=True)
+def shi_tomasi_corner(gray, min_response):
+    """
+    Strongest Shi-Tomasi corner in a grayscale image.
+
+    Two passes: the Sobel gradient products are computed once per pixel
+    into full-frame images, then each 5x5-window structure tensor is
+    box-summed with a running window per row and scored by its minimum
+    eigenvalue. Rows run in parallel with per-row argmax accumulators
+    reduced at the end, so there is no shared-state contention.
+
+    Args:
+        gray: (H, W) uint8 grayscale image
+        min_response: Minimum eigenvalue response to count as a corner
+
+    Returns:
+        (x, y) pixel coordinates of the best corner, or (-1, -1) if
+        nothing scored above min_response
+    """
+    h, w = gray.shape
+    if h < 7 or w < 7:
+        # Too small to hold even one 5x5 window plus Sobel borders -
+        # the window math below would index out of bounds (unchecked
+        # under njit)
+        return (-1, -1)
+
+    ixx = np.zeros((h, w), np.float32)
+    iyy = np.zeros((h, w), np.float32)
+    ixy = np.zeros((h, w), np.float32)
+
+    # Pass 1: one Sobel evaluation per pixel
+    for y in prange(1, h - 1):
+        for x in range(1, w - 1):
+            gx = ((int(gray[y - 1, x + 1]) +
+                   2 * int(gray[y, x + 1]) +
+                   int(gray[y + 1, x + 1])) -
+                  (int(gray[y - 1, x - 1]) +
+                   2 * int(gray[y, x - 1]) +
+                   int(gray[y + 1, x - 1])))
+            gy = ((int(gray[y + 1, x - 1]) +
+                   2 * int(gray[y + 1, x]) +
+                   int(gray[y + 1, x + 1])) -
+                  (int(gray[y - 1, x - 1]) +
+                   2 * int(gray[y - 1, x]) +
+                   int(gray[y - 1, x + 1])))
+            ixx[y, x] = gx * gx
+            iyy[y, x] = gy * gy
+            ixy[y, x] = gx * gy
+
+    # Pass 2: slide the 5x5 window along each row, exchanging one
+    # 5-element column per step instead of re-summing 25 products
+    row_best = np.zeros(h)
+    row_col = np.full(h, -1, np.int64)
+
+    for y in prange(3, h - 3):
+        best = 0.0
+        best_x = -1
+
+        wxx = 0.0
+        wyy = 0.0
+        wxy = 0.0
+        for xx in range(1, 6):
+            for yy in range(y - 2, y + 3):
+                wxx += ixx[yy, xx]
+                wyy += iyy[yy, xx]
+                wxy += ixy[yy, xx]
+
+        x = 3
+        while True:
+            # Minimum eigenvalue of [[wxx, wxy], [wxy, wyy]]
+            trace = wxx + wyy
+            split = math.sqrt((wxx - wyy) * (wxx - wyy) + 4.0 * wxy * wxy)
+            response = 0.5 * (trace - split)
+            if response > best:
+                best = response
+                best_x = x
+
+            x += 1
+            if x > w - 4:
+                break
+            x_out = x - 3
+            x_in = x + 2
+            for yy in range(y - 2, y + 3):
+                wxx += ixx[yy, x_in] - ixx[yy, x_out]
+                wyy += iyy[yy, x_in] - iyy[yy, x_out]
+                wxy += ixy[yy, x_in] - ixy[yy, x_out]
+
+        row_best[y] = best
+        row_col[y] = best_x
+
+    best_y = -1
+    best_val = min_response
+    for y in range(h):
+        if row_best[y] > best_val:
+            best_val = row_best[y]
+            best_y = y
+
+    if best_y < 0:
+        return (-1, -1)
+    return (int(row_col[best_y]), best_y)
+
+
+# Precompile at import so the first frame doesn't pay compile time
+if HAVE_NUMBA:
+    shi_tomasi_corner(np.zeros((8, 8), np.uint8), 1.0)
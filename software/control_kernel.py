@@ -0,0 +1,73 @@
+"""
+Numba-compiled servo control kernels.
+
+Whole-vector angle/position conversion extracted into free functions so
+a closed-loop controller (leg feedback -> control law -> servo write)
+spends its per-tick numeric work in compiled code, leaving only the
+serial/I2C I/O in Python. Falls back to plain Python if numba is not
+installed.
+
+Like _ik_kernels, these are compiled and warmed at import rather than
+disk-cached: the module is imported both flat and as
+software.control_kernel, and numba's cache is keyed to one module name.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    print("Warning: numba not installed. Run: pip install numba "
+          "(control kernels will run without JIT compilation)")
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is unavailable"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(fastmath=True)
+def angles_to_lx_positions(angles, scales, offsets, lo, hi, out):
+    """
+    Convert joint angles in degrees to clipped LX-16A positions.
+
+    Args:
+        angles: (N,) float64 target angles in degrees
+        scales: (N,) per-joint angle->position scale factors
+        offsets: (N,) per-joint position offsets
+        lo, hi: (N,) per-joint position limits
+        out: (N,) int16 output buffer, filled in place
+    """
+    for i in range(angles.shape[0]):
+        p = angles[i] * scales[i] + offsets[i]
+        if p < lo[i]:
+            p = lo[i]
+        elif p > hi[i]:
+            p = hi[i]
+        out[i] = int(p)
+
+
+@njit(fastmath=True)
+def lx_positions_to_angles(positions, inv_scales, offsets, out):
+    """
+    Convert LX-16A feedback positions to joint angles in degrees.
+
+    Args:
+        positions: (N,) raw positions (0-1000)
+        inv_scales: (N,) per-joint position->angle scale factors
+        offsets: (N,) per-joint position offsets
+        out: (N,) float64 output buffer, filled in place
+    """
+    for i in range(positions.shape[0]):
+        out[i] = (positions[i] - offsets[i]) * inv_scales[i]
+
+
+# Precompile at import so the first control tick doesn't pay compile time
+angles_to_lx_positions(np.zeros(1), np.ones(1), np.zeros(1),
+                       np.zeros(1), np.full(1, 1000.0),
+                       np.zeros(1, np.int16))
+lx_positions_to_angles(np.zeros(1), np.ones(1), np.zeros(1), np.zeros(1))
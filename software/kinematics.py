@@ -5,15 +5,50 @@ Implements IK solver for Artisan-1's 5-DOF arm to enable
 visually-guided reaching and manipulation.
 """
 
+import math
+import time
 import numpy as np
 import logging
 from typing import Tuple, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from _ik_kernels import (_fk_error_sq, _solve_ik_batch,
+                             make_specialized_kernels)
+except ImportError:
+    from software._ik_kernels import (_fk_error_sq, _solve_ik_batch,
+                                      make_specialized_kernels)
+
+try:
+    from servo_controller import JointLocation
+except ImportError:
+    from software.servo_controller import JointLocation
+
 
 logger = logging.getLogger(__name__)
 
+# Degree/radian conversion as a plain multiply - avoids a function call
+# per converted angle on the per-frame paths
+_D2R = math.pi / 180.0
+
+# Arm joint groups in JointAngles field order, precomputed so
+# move_to_position doesn't rebuild a dict literal on every call
+_LEFT_ARM_JOINTS = (
+    JointLocation.LEFT_SHOULDER_PITCH,
+    JointLocation.LEFT_SHOULDER_ROLL,
+    JointLocation.LEFT_SHOULDER_YAW,
+    JointLocation.LEFT_ELBOW,
+    JointLocation.LEFT_WRIST,
+)
+_RIGHT_ARM_JOINTS = (
+    JointLocation.RIGHT_SHOULDER_PITCH,
+    JointLocation.RIGHT_SHOULDER_ROLL,
+    JointLocation.RIGHT_SHOULDER_YAW,
+    JointLocation.RIGHT_ELBOW,
+    JointLocation.RIGHT_WRIST,
+)
+
 
 class ArmSide(Enum):
     """Which arm to control"""
@@ -21,7 +56,7 @@ class ArmSide(Enum):
     RIGHT = "right"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArmConfiguration:
     """DH parameters and joint limits for robot arm"""
     # Link lengths in meters
@@ -29,7 +64,7 @@ class ArmConfiguration:
     upper_arm_length: float = 0.25  # Upper arm (humerus)
     forearm_length: float = 0.20  # Forearm (radius/ulna)
     hand_length: float = 0.10  # Hand to fingertip
-    
+
     # Joint limits in degrees
     shoulder_pitch_min: float = -90
     shoulder_pitch_max: float = 180
@@ -42,6 +77,19 @@ class ArmConfiguration:
     wrist_min: float = -90
     wrist_max: float = 90
 
+    def __post_init__(self):
+        """Cache derived constants so solve_ik doesn't recompute per call"""
+        l1 = self.upper_arm_length
+        l2 = self.forearm_length + self.hand_length
+        object.__setattr__(self, 'l1', l1)
+        object.__setattr__(self, 'l2_eff', l2)
+        object.__setattr__(self, 'max_reach', l1 + l2)
+        object.__setattr__(self, 'max_reach_sq', (l1 + l2) * (l1 + l2))
+        object.__setattr__(self, 'min_reach_2d', abs(l1 - l2))
+        object.__setattr__(self, 'two_l1_l2', 2.0 * l1 * l2)
+        object.__setattr__(self, 'l1_sq', l1 * l1)
+        object.__setattr__(self, 'l2_sq', l2 * l2)
+
 
 @dataclass
 class JointAngles:
@@ -69,6 +117,18 @@ class InverseKinematics:
             config: Arm configuration parameters
         """
         self.config = config if config else ArmConfiguration()
+
+        # Specialize the kernels for this configuration's link lengths
+        # (constant-folded by the JIT) and warm them so the first real
+        # call doesn't pay compile time
+        cfg = self.config
+        (self._solve_fixed, self._solve_oriented_fixed,
+         self._fk_fixed) = make_specialized_kernels(
+            cfg.upper_arm_length, cfg.forearm_length, cfg.hand_length)
+        self._solve_fixed(cfg.max_reach * 0.5, 0.0, 0.0, 1.0)
+        self._solve_oriented_fixed(cfg.max_reach * 0.5, 0.0, 0.0, 0.0, 1.0)
+        self._fk_fixed(0.0, 0.0, 0.0, 0.0, 0.0)
+
         logger.info("IK Solver initialized")
     
     def forward_kinematics(self, angles: JointAngles) -> Tuple[float, float, float]:
@@ -81,38 +141,49 @@ class InverseKinematics:
         Returns:
             (x, y, z) position in meters
         """
-        # Convert to radians
-        sp = np.radians(angles.shoulder_pitch)
-        sr = np.radians(angles.shoulder_roll)
-        sy = np.radians(angles.shoulder_yaw)
-        e = np.radians(angles.elbow)
-        w = np.radians(angles.wrist)
-        
-        # Simplified FK calculation
+        # Simplified FK calculation - compiled kernel does the math
         # This is a geometric approach - for production use DH parameters
-        
-        # Calculate reach in horizontal plane
-        horizontal_reach = (
-            self.config.upper_arm_length * np.cos(sr) * np.cos(sp) +
-            self.config.forearm_length * np.cos(sr + e) * np.cos(sp) +
-            self.config.hand_length * np.cos(sr + e) * np.cos(sp)
-        )
-        
-        # Calculate height
-        height = (
-            self.config.upper_arm_length * np.sin(sr) +
-            self.config.forearm_length * np.sin(sr + e) +
-            self.config.hand_length * np.sin(sr + e)
+        return self._fk_fixed(
+            angles.shoulder_pitch * _D2R,
+            angles.shoulder_roll * _D2R,
+            angles.shoulder_yaw * _D2R,
+            angles.elbow * _D2R,
+            angles.wrist * _D2R
         )
-        
-        # Apply yaw rotation
+    
+    def forward_kinematics_batch(self, angles_array: np.ndarray) -> np.ndarray:
+        """
+        Calculate end-effector positions for a batch of joint configurations.
+
+        Vectorized FK - one ufunc dispatch per trig term instead of one
+        Python call per configuration.
+
+        Args:
+            angles_array: (N, 5) array of joint angles in radians
+                          (shoulder_pitch, shoulder_roll, shoulder_yaw,
+                           elbow, wrist)
+
+        Returns:
+            (N, 3) array of (x, y, z) positions in meters
+        """
+        sp, sr, sy, e, w = np.asarray(angles_array, dtype=np.float64).T
+
+        l1 = self.config.upper_arm_length
+        l23 = self.config.l2_eff
+
+        # Shared trig terms computed once per batch
+        c_sp = np.cos(sp)
+        c_sre = np.cos(sr + e)
+
+        horizontal_reach = l1 * np.cos(sr) * c_sp + l23 * c_sre * c_sp
+        z = l1 * np.sin(sr) + l23 * np.sin(sr + e)
+
         x = horizontal_reach * np.cos(sy)
         y = horizontal_reach * np.sin(sy)
-        z = height
-        
-        return (x, y, z)
-    
-    def solve_ik(self, 
+
+        return np.stack([x, y, z], axis=1)
+
+    def solve_ik(self,
                  target_x: float, 
                  target_y: float, 
                  target_z: float,
@@ -132,56 +203,38 @@ class InverseKinematics:
         Returns:
             JointAngles solution or None if unreachable
         """
-        # Calculate distance to target
-        target_distance = np.sqrt(target_x**2 + target_y**2 + target_z**2)
-        
-        # Check if target is reachable
-        max_reach = (self.config.upper_arm_length + 
-                    self.config.forearm_length + 
-                    self.config.hand_length)
-        
-        if target_distance > max_reach:
-            logger.warning(f"Target unreachable: {target_distance:.3f}m > {max_reach:.3f}m")
+        cfg = self.config
+
+        # Check if target is reachable - squared distances, so the
+        # sqrt only runs when we actually report the failure
+        dist_sq = (target_x*target_x + target_y*target_y +
+                   target_z*target_z)
+        if dist_sq > cfg.max_reach_sq:
+            logger.warning("Target unreachable: %.3fm > %.3fm",
+                           math.sqrt(dist_sq), cfg.max_reach)
             return None
-        
-        # Solve shoulder yaw (rotation in horizontal plane)
-        shoulder_yaw = np.degrees(np.arctan2(target_y, target_x))
-        
-        # Mirror for right arm
-        if arm_side == ArmSide.RIGHT:
-            shoulder_yaw = -shoulder_yaw
-        
-        # Calculate horizontal distance
-        horizontal_dist = np.sqrt(target_x**2 + target_y**2)
-        
-        # Solve for shoulder pitch and roll using 2D IK in sagittal plane
-        # Simplify to 2-link arm (upper + forearm+hand)
-        l1 = self.config.upper_arm_length
-        l2 = self.config.forearm_length + self.config.hand_length
-        
-        # Target in arm's local 2D plane
-        r = np.sqrt(horizontal_dist**2 + target_z**2)
-        
-        # Check reachability in 2D plane
-        if r > l1 + l2 or r < abs(l1 - l2):
+
+        # Geometric decomposition runs in the compiled kernel
+        arm_sign = -1.0 if arm_side == ArmSide.RIGHT else 1.0
+
+        (shoulder_pitch, shoulder_roll, shoulder_yaw,
+         elbow_angle, wrist_rotation, ok) = self._solve_fixed(
+            target_x, target_y, target_z, arm_sign)
+
+        if not ok:
             logger.warning("Target unreachable in 2D plane")
             return None
-        
-        # Law of cosines for elbow angle
-        cos_elbow = (l1**2 + l2**2 - r**2) / (2 * l1 * l2)
-        cos_elbow = np.clip(cos_elbow, -1, 1)  # Numerical stability
-        elbow_angle = np.degrees(np.arccos(cos_elbow))
-        
-        # Calculate shoulder angles
-        alpha = np.arctan2(target_z, horizontal_dist)
-        beta = np.arccos((l1**2 + r**2 - l2**2) / (2 * l1 * r))
-        
-        shoulder_roll = np.degrees(alpha + beta)
-        shoulder_pitch = 0  # Simplified - can be adjusted for orientation
-        
-        # Wrist rotation (simplified - keep hand level)
-        wrist_rotation = 0
-        
+
+        # Check joint limits inline - short-circuits on the first
+        # out-of-range joint, no list allocation or extra call frame
+        if not (cfg.shoulder_pitch_min <= shoulder_pitch <= cfg.shoulder_pitch_max and
+                cfg.shoulder_roll_min <= shoulder_roll <= cfg.shoulder_roll_max and
+                cfg.shoulder_yaw_min <= shoulder_yaw <= cfg.shoulder_yaw_max and
+                cfg.elbow_min <= elbow_angle <= cfg.elbow_max and
+                cfg.wrist_min <= wrist_rotation <= cfg.wrist_max):
+            logger.warning("Solution violates joint limits")
+            return None
+
         # Create solution
         solution = JointAngles(
             shoulder_pitch=shoulder_pitch,
@@ -190,16 +243,80 @@ class InverseKinematics:
             elbow=elbow_angle,
             wrist=wrist_rotation
         )
-        
-        # Check joint limits
-        if not self._check_joint_limits(solution):
-            logger.warning("Solution violates joint limits")
-            return None
-        
-        logger.info(f"IK solution found for target ({target_x:.3f}, {target_y:.3f}, {target_z:.3f})")
+
+        # %-style lazy formatting - the three floats aren't formatted
+        # when INFO is silenced in production
+        logger.info("IK solution found for target (%.3f, %.3f, %.3f)",
+                    target_x, target_y, target_z)
         
         return solution
     
+    def verify_squared_error(self,
+                             angles: JointAngles,
+                             target: Tuple[float, float, float]) -> float:
+        """
+        Squared 3D error between FK(angles) and a target position.
+
+        Single fused kernel call - no intermediate position tuple or
+        Python-level subtractions, useful for per-frame verification.
+
+        Args:
+            angles: Joint angles in degrees
+            target: (x, y, z) target position in meters
+
+        Returns:
+            Squared position error in square meters
+        """
+        cfg = self.config
+        return _fk_error_sq(
+            angles.shoulder_pitch * _D2R,
+            angles.shoulder_roll * _D2R,
+            angles.shoulder_yaw * _D2R,
+            angles.elbow * _D2R,
+            angles.wrist * _D2R,
+            target[0], target[1], target[2],
+            cfg.upper_arm_length, cfg.forearm_length, cfg.hand_length)
+
+    def solve_ik_batch(self,
+                       targets: np.ndarray,
+                       arm_side: ArmSide = ArmSide.LEFT,
+                       out: Optional[np.ndarray] = None,
+                       ok: Optional[np.ndarray] = None
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve IK for many targets in one parallel kernel call.
+
+        Amortizes dispatch over the batch; the kernel loops with
+        numba.prange so candidate targets are solved across cores.
+        Output arrays can be passed in to reuse buffers between frames.
+
+        Args:
+            targets: (N, 3) array of target positions in meters
+            arm_side: Which arm (affects shoulder yaw calculation)
+            out: Optional preallocated (N, 5) float64 output array
+            ok: Optional preallocated (N,) bool output array
+
+        Returns:
+            (angles, ok) - (N, 5) joint angles in degrees and an (N,)
+            boolean mask, False where unreachable or out of joint limits
+        """
+        cfg = self.config
+        targets = np.ascontiguousarray(targets, dtype=np.float64)
+        n = targets.shape[0]
+
+        if out is None:
+            out = np.empty((n, 5), dtype=np.float64)
+        if ok is None:
+            ok = np.empty(n, dtype=np.bool_)
+
+        arm_sign = -1.0 if arm_side == ArmSide.RIGHT else 1.0
+        _solve_ik_batch(targets, out, ok,
+                        cfg.upper_arm_length, cfg.forearm_length,
+                        cfg.hand_length, arm_sign)
+
+        ok &= self.check_joint_limits_batch(out)
+        return out, ok
+
     def _check_joint_limits(self, angles: JointAngles) -> bool:
         """
         Check if joint angles are within limits.
@@ -210,20 +327,30 @@ class InverseKinematics:
         Returns:
             True if all angles within limits
         """
-        checks = [
-            (self.config.shoulder_pitch_min <= angles.shoulder_pitch <= 
-             self.config.shoulder_pitch_max),
-            (self.config.shoulder_roll_min <= angles.shoulder_roll <= 
-             self.config.shoulder_roll_max),
-            (self.config.shoulder_yaw_min <= angles.shoulder_yaw <= 
-             self.config.shoulder_yaw_max),
-            (self.config.elbow_min <= angles.elbow <= 
-             self.config.elbow_max),
-            (self.config.wrist_min <= angles.wrist <= 
-             self.config.wrist_max),
-        ]
-        
-        return all(checks)
+        cfg = self.config
+        return (cfg.shoulder_pitch_min <= angles.shoulder_pitch <= cfg.shoulder_pitch_max and
+                cfg.shoulder_roll_min <= angles.shoulder_roll <= cfg.shoulder_roll_max and
+                cfg.shoulder_yaw_min <= angles.shoulder_yaw <= cfg.shoulder_yaw_max and
+                cfg.elbow_min <= angles.elbow <= cfg.elbow_max and
+                cfg.wrist_min <= angles.wrist <= cfg.wrist_max)
+
+    def check_joint_limits_batch(self, angles_array: np.ndarray) -> np.ndarray:
+        """
+        Vectorized joint-limit check for a batch of solutions.
+
+        Args:
+            angles_array: (N, 5) array of joint angles in degrees
+
+        Returns:
+            (N,) boolean array, True where all joints are within limits
+        """
+        cfg = self.config
+        lo = np.array([cfg.shoulder_pitch_min, cfg.shoulder_roll_min,
+                       cfg.shoulder_yaw_min, cfg.elbow_min, cfg.wrist_min])
+        hi = np.array([cfg.shoulder_pitch_max, cfg.shoulder_roll_max,
+                       cfg.shoulder_yaw_max, cfg.elbow_max, cfg.wrist_max])
+        a = np.asarray(angles_array)
+        return ((a >= lo) & (a <= hi)).all(axis=1)
     
     def solve_ik_with_orientation(self,
                                   target_x: float,
@@ -244,19 +371,38 @@ class InverseKinematics:
         Returns:
             Joint angles or None if unreachable
         """
-        # Adjust target to account for hand length at desired angle
-        approach_rad = np.radians(approach_angle)
-        adjusted_x = target_x - self.config.hand_length * np.cos(approach_rad)
-        adjusted_z = target_z - self.config.hand_length * np.sin(approach_rad)
-        
-        # Solve for wrist position
-        solution = self.solve_ik(adjusted_x, target_y, adjusted_z, arm_side)
-        
-        if solution:
-            # Adjust wrist to achieve desired orientation
-            solution.wrist = approach_angle
-        
-        return solution
+        cfg = self.config
+
+        # Fused kernel shifts the target back to the wrist point and
+        # solves the 2-link chain without the hand length (the old
+        # two-step path double-counted hand_length)
+        arm_sign = -1.0 if arm_side == ArmSide.RIGHT else 1.0
+
+        (shoulder_pitch, shoulder_roll, shoulder_yaw,
+         elbow_angle, _, ok) = self._solve_oriented_fixed(
+            target_x, target_y, target_z,
+            approach_angle * _D2R, arm_sign)
+
+        if not ok:
+            logger.warning("Oriented target unreachable")
+            return None
+
+        # Wrist achieves the desired orientation
+        if not (cfg.shoulder_pitch_min <= shoulder_pitch <= cfg.shoulder_pitch_max and
+                cfg.shoulder_roll_min <= shoulder_roll <= cfg.shoulder_roll_max and
+                cfg.shoulder_yaw_min <= shoulder_yaw <= cfg.shoulder_yaw_max and
+                cfg.elbow_min <= elbow_angle <= cfg.elbow_max and
+                cfg.wrist_min <= approach_angle <= cfg.wrist_max):
+            logger.warning("Solution violates joint limits")
+            return None
+
+        return JointAngles(
+            shoulder_pitch=shoulder_pitch,
+            shoulder_roll=shoulder_roll,
+            shoulder_yaw=shoulder_yaw,
+            elbow=elbow_angle,
+            wrist=approach_angle
+        )
 
 
 class ArmController:
@@ -264,16 +410,28 @@ class ArmController:
     High-level arm controller that combines IK with servo control.
     """
     
-    def __init__(self, servo_controller, ik_solver: Optional[InverseKinematics] = None):
+    # Targets closer than this to the previous one reuse its solution
+    WARM_START_EPSILON = 0.005  # meters
+
+    def __init__(self, servo_controller,
+                 ik_solver: Optional[InverseKinematics] = None,
+                 warm_start: bool = True):
         """
         Initialize arm controller.
-        
+
         Args:
             servo_controller: Instance of ArtisanServoController
             ik_solver: IK solver instance (creates default if None)
+            warm_start: Reuse the previous IK solution when the target
+                        has moved less than WARM_START_EPSILON (useful
+                        for continuous tracking; set False to always
+                        solve from scratch)
         """
         self.servo = servo_controller
         self.ik = ik_solver if ik_solver else InverseKinematics()
+        self.warm_start = warm_start
+        self._last_solution: Optional[JointAngles] = None
+        self._last_target: Optional[Tuple[float, float, float, ArmSide]] = None
         logger.info("Arm Controller initialized")
     
     def move_to_position(self,
@@ -281,52 +439,63 @@ class ArmController:
                         target_y: float,
                         target_z: float,
                         arm_side: ArmSide = ArmSide.LEFT,
-                        movement_time_ms: int = 1000) -> bool:
+                        movement_time_ms: int = 1000,
+                        wait: bool = False) -> bool:
         """
         Move arm end-effector to target position.
-        
+
         Args:
             target_x: Target X coordinate in meters
             target_y: Target Y coordinate in meters
             target_z: Target Z coordinate in meters
             arm_side: Which arm to move
             movement_time_ms: Movement duration
-            
+            wait: Block until the servos report the move complete
+                  (polls position feedback rather than sleeping the
+                  full commanded time)
+
         Returns:
             True if successful, False if target unreachable
         """
-        # Solve IK
-        solution = self.ik.solve_ik(target_x, target_y, target_z, arm_side)
-        
+        # Warm start: a target within epsilon of the previous one for
+        # the same arm reuses the cached solution outright
+        solution = None
+        if self.warm_start and self._last_target is not None:
+            lx, ly, lz, last_side = self._last_target
+            if (last_side == arm_side and
+                    math.hypot(target_x - lx, target_y - ly, target_z - lz)
+                    < self.WARM_START_EPSILON):
+                solution = self._last_solution
+
         if solution is None:
-            logger.error("IK solution failed - target unreachable")
-            return False
-        
-        # Map to servo joints
-        from servo_controller import JointLocation
-        
-        if arm_side == ArmSide.LEFT:
-            joints = {
-                JointLocation.LEFT_SHOULDER_PITCH: solution.shoulder_pitch,
-                JointLocation.LEFT_SHOULDER_ROLL: solution.shoulder_roll,
-                JointLocation.LEFT_SHOULDER_YAW: solution.shoulder_yaw,
-                JointLocation.LEFT_ELBOW: solution.elbow,
-                JointLocation.LEFT_WRIST: solution.wrist,
-            }
-        else:
-            joints = {
-                JointLocation.RIGHT_SHOULDER_PITCH: solution.shoulder_pitch,
-                JointLocation.RIGHT_SHOULDER_ROLL: solution.shoulder_roll,
-                JointLocation.RIGHT_SHOULDER_YAW: solution.shoulder_yaw,
-                JointLocation.RIGHT_ELBOW: solution.elbow,
-                JointLocation.RIGHT_WRIST: solution.wrist,
-            }
-        
-        # Command servos
-        for joint, angle in joints.items():
-            self.servo.set_joint_angle(joint, angle, movement_time_ms)
-        
-        logger.info(f"Commanded {arm_side.value} arm to ({target_x:.3f}, {target_y:.3f}, {target_z:.3f})")
+            solution = self.ik.solve_ik(target_x, target_y, target_z, arm_side)
+
+            if solution is None:
+                logger.error("IK solution failed - target unreachable")
+                return False
+
+            self._last_solution = solution
+            self._last_target = (target_x, target_y, target_z, arm_side)
+        
+        # Map to servo joints (precomputed module-level tuples)
+        joints = (_LEFT_ARM_JOINTS if arm_side == ArmSide.LEFT
+                  else _RIGHT_ARM_JOINTS)
+        angles = (solution.shoulder_pitch, solution.shoulder_roll,
+                  solution.shoulder_yaw, solution.elbow, solution.wrist)
+
+        # Command servos in one batched call
+        self.servo.set_joint_angles_batch(joints, angles, movement_time_ms)
+
+        if wait:
+            # Safety margin applies to the polling deadline only;
+            # feedback-less joints sleep the commanded duration
+            self.servo.wait_for_motion_complete(
+                dict(zip(joints, angles)),
+                timeout_ms=int(movement_time_ms * 1.2),
+                movement_time_ms=movement_time_ms)
+
+        logger.info("Commanded %s arm to (%.3f, %.3f, %.3f)",
+                    arm_side.value, target_x, target_y, target_z)
         return True
     
     def reach_and_grasp(self,
@@ -346,41 +515,42 @@ class ArmController:
         Returns:
             True if grasp attempted successfully
         """
-        from servo_controller import JointLocation
-        import time
-        
-        # Move to pre-grasp position (above target)
+        # Move to pre-grasp position (above target), returning as soon
+        # as the servos report arrival instead of sleeping the full
+        # commanded duration
         pre_grasp_z = target_z + 0.05  # 5cm above
-        success = self.move_to_position(target_x, target_y, pre_grasp_z, arm_side, 1500)
-        
+        success = self.move_to_position(target_x, target_y, pre_grasp_z,
+                                        arm_side, 1500, wait=True)
+
         if not success:
             return False
-        
-        time.sleep(1.5)  # Wait for movement
-        
+
         # Open hand
-        hand_fingers = (JointLocation.LEFT_HAND_FINGERS if arm_side == ArmSide.LEFT 
+        hand_fingers = (JointLocation.LEFT_HAND_FINGERS if arm_side == ArmSide.LEFT
                        else JointLocation.RIGHT_HAND_FINGERS)
         hand_thumb = (JointLocation.LEFT_HAND_THUMB if arm_side == ArmSide.LEFT
                      else JointLocation.RIGHT_HAND_THUMB)
-        
+
         self.servo.set_joint_angle(hand_fingers, 0)  # Open
         self.servo.set_joint_angle(hand_thumb, 0)
-        time.sleep(0.5)
-        
+        self.servo.wait_for_motion_complete(
+            {hand_fingers: 0, hand_thumb: 0}, timeout_ms=500)
+
         # Descend to target
-        self.move_to_position(target_x, target_y, target_z, arm_side, 800)
-        time.sleep(0.8)
-        
+        self.move_to_position(target_x, target_y, target_z, arm_side, 800,
+                              wait=True)
+
         # Close grasp
         self.servo.set_joint_angle(hand_fingers, 90)  # Close
         self.servo.set_joint_angle(hand_thumb, 90)
-        time.sleep(0.5)
-        
+        self.servo.wait_for_motion_complete(
+            {hand_fingers: 90, hand_thumb: 90}, timeout_ms=500)
+        time.sleep(0.05)  # Let tactile readings settle
+
         # Lift
         self.move_to_position(target_x, target_y, target_z + 0.10, arm_side, 1000)
         
-        logger.info(f"Grasp sequence completed for {arm_side.value} arm")
+        logger.info("Grasp sequence completed for %s arm", arm_side.value)
         return True
 
 
@@ -426,9 +596,8 @@ if __name__ == "__main__":
             print(f"    Elbow:          {solution.elbow:.1f}°")
             print(f"    Wrist:          {solution.wrist:.1f}°")
             
-            # Verify with FK
-            verify_pos = ik.forward_kinematics(solution)
-            error = np.sqrt((verify_pos[0]-x)**2 + (verify_pos[1]-y)**2 + (verify_pos[2]-z)**2)
+            # Verify with FK (fused error kernel)
+            error = math.sqrt(ik.verify_squared_error(solution, (x, y, z)))
             print(f"  Verification error: {error*1000:.1f} mm")
         else:
             print("  No solution found (unreachable)")
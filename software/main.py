@@ -11,6 +11,8 @@ import sys
 from typing import Optional
 from enum import Enum
 
+import numpy as np
+
 from servo_controller import ArtisanServoController, JointLocation
 from tactile_sensing import ArtisanHandSensing
 from vision import VisionSystem, FabricDetector
@@ -29,6 +31,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Neutral standing pose as parallel joint/angle arrays (SoA) so the whole
+# pose goes through one batched servo call instead of a per-joint dict loop
+_NEUTRAL_JOINTS = (
+    JointLocation.HEAD_PAN,
+    JointLocation.HEAD_TILT,
+    # Left arm
+    JointLocation.LEFT_SHOULDER_PITCH,
+    JointLocation.LEFT_SHOULDER_ROLL,
+    JointLocation.LEFT_SHOULDER_YAW,
+    JointLocation.LEFT_ELBOW,
+    JointLocation.LEFT_WRIST,
+    # Right arm
+    JointLocation.RIGHT_SHOULDER_PITCH,
+    JointLocation.RIGHT_SHOULDER_ROLL,
+    JointLocation.RIGHT_SHOULDER_YAW,
+    JointLocation.RIGHT_ELBOW,
+    JointLocation.RIGHT_WRIST,
+)
+_NEUTRAL_ANGLES = np.array(
+    [90, 90,
+     90, 45, 90, 45, 90,
+     90, 45, 90, 45, 90],
+    dtype=np.float32
+)
+
+
 class RobotState(Enum):
     """Robot operational states"""
     INITIALIZING = "initializing"
@@ -120,29 +148,10 @@ class Artisan1Robot:
         logger.info("Moving to neutral pose...")
         
         try:
-            # Head centered
-            self.servo_controller.set_joint_angle(JointLocation.HEAD_PAN, 90)
-            self.servo_controller.set_joint_angle(JointLocation.HEAD_TILT, 90)
-            
-            # Arms at sides
-            neutral_angles = {
-                # Left arm
-                JointLocation.LEFT_SHOULDER_PITCH: 90,
-                JointLocation.LEFT_SHOULDER_ROLL: 45,
-                JointLocation.LEFT_SHOULDER_YAW: 90,
-                JointLocation.LEFT_ELBOW: 45,
-                JointLocation.LEFT_WRIST: 90,
-                # Right arm
-                JointLocation.RIGHT_SHOULDER_PITCH: 90,
-                JointLocation.RIGHT_SHOULDER_ROLL: 45,
-                JointLocation.RIGHT_SHOULDER_YAW: 90,
-                JointLocation.RIGHT_ELBOW: 45,
-                JointLocation.RIGHT_WRIST: 90,
-            }
-            
-            for joint, angle in neutral_angles.items():
-                self.servo_controller.set_joint_angle(joint, angle, time_ms=2000)
-            
+            # Head and arms in one batched command
+            self.servo_controller.set_joint_angles_batch(
+                _NEUTRAL_JOINTS, _NEUTRAL_ANGLES, time_ms=2000)
+
             time.sleep(2)
             logger.info("Neutral pose achieved")
             
@@ -166,7 +175,7 @@ class Artisan1Robot:
         logger.info("=" * 60)
         
         for attempt in range(1, max_attempts + 1):
-            logger.info(f"\nAttempt {attempt}/{max_attempts}")
+            logger.info("\nAttempt %d/%d", attempt, max_attempts)
             
             # Step 1: Visual Detection
             logger.info("Step 1: Scanning for fabric corner...")
@@ -180,7 +189,7 @@ class Artisan1Robot:
                 continue
             
             target_world = detection["world_coords"]
-            logger.info(f"Fabric corner detected at {target_world}")
+            logger.info("Fabric corner detected at %s", target_world)
             
             # Step 2: Reach to target
             logger.info("Step 2: Reaching to target...")
@@ -217,11 +226,10 @@ class Artisan1Robot:
                     target_world[1],
                     target_world[2] + 0.15,  # Lift 15cm
                     arm_side=ArmSide.LEFT,
-                    movement_time_ms=1500
+                    movement_time_ms=1500,
+                    wait=True
                 )
                 
-                time.sleep(2)
-                
                 logger.info("=" * 60)
                 logger.info("DEMONSTRATION SUCCESSFUL!")
                 logger.info("=" * 60)
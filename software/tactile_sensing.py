@@ -7,6 +7,8 @@ for tactile feedback in robot hands.
 
 import time
 import logging
+
+import numpy as np
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
@@ -21,8 +23,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Volts per ADC count at the PGA's +/-4.096 V full-scale range - the
+# one scale used by every voltage conversion in this module, scalar or
+# vectorized, so thresholds mean the same thing on both paths
+_ADC_VOLTS_PER_COUNT = 4.096 / 32768
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FSRReading:
     """Force Sensitive Resistor reading data"""
     sensor_id: str
@@ -41,9 +48,13 @@ class FSRSensor:
     
     As pressure increases, FSR resistance decreases, voltage at ADC pin increases.
     """
+
+    # Conversion period at the 860 SPS continuous data rate
+    _SAMPLE_PERIOD_S = 1.0 / 860
     
     def __init__(self, analog_channel: AnalogIn, sensor_id: str, 
-                 pulldown_resistance: float = 10000.0):
+                 pulldown_resistance: float = 10000.0,
+                 timestamp: bool = False):
         """
         Initialize FSR sensor.
         
@@ -51,11 +62,15 @@ class FSRSensor:
             analog_channel: ADS1115 analog input channel
             sensor_id: Unique identifier for this sensor
             pulldown_resistance: Fixed resistor value in ohms (default 10kΩ)
+            timestamp: Stamp readings with time.monotonic_ns(); off by
+                       default since the grasp checks never use it
         """
         self.channel = analog_channel
         self.sensor_id = sensor_id
         self.pulldown_resistance = pulldown_resistance
+        self._timestamp = timestamp
         self.baseline_reading = 0
+        self._baseline_voltage = 0.0
         self.calibrated = False
     
     def calibrate_baseline(self, num_samples: int = 10) -> None:
@@ -65,12 +80,18 @@ class FSRSensor:
         Args:
             num_samples: Number of samples to average
         """
-        readings = []
-        for _ in range(num_samples):
-            readings.append(self.channel.value)
-            time.sleep(0.01)
-        
-        self.baseline_reading = sum(readings) / len(readings)
+        # Continuous mode produces a new conversion only every
+        # ~1.16 ms at 860 SPS - pace the reads at the data rate so the
+        # average really covers num_samples distinct samples
+        buf = np.empty(num_samples, dtype=np.int32)
+        for i in range(num_samples):
+            buf[i] = self.channel.value
+            if i < num_samples - 1:
+                time.sleep(self._SAMPLE_PERIOD_S)
+
+        self.baseline_reading = float(buf.mean())
+        # Cached so read() doesn't redo the scale multiply per call
+        self._baseline_voltage = self.baseline_reading * _ADC_VOLTS_PER_COUNT
         self.calibrated = True
         logger.info(f"{self.sensor_id} calibrated. Baseline: {self.baseline_reading}")
     
@@ -87,7 +108,7 @@ class FSRSensor:
         # Estimate force based on voltage change from baseline
         # This is a simplified model - actual force requires calibration curve
         if self.calibrated:
-            voltage_change = voltage - (self.baseline_reading * 5.0 / 32768)
+            voltage_change = voltage - self._baseline_voltage
             # Rough estimate: map voltage change to 0-100 force units
             force_estimate = max(0, min(100, voltage_change * 20))
         else:
@@ -98,9 +119,21 @@ class FSRSensor:
             raw_value=raw_value,
             voltage=voltage,
             force_estimate=force_estimate,
-            timestamp=time.time()
+            timestamp=time.monotonic_ns() if self._timestamp else 0
         )
     
+    def read_voltage_only(self) -> float:
+        """
+        Read just the channel voltage - no FSRReading construction.
+
+        The fast path for grasp checks and force polling, which never
+        look at the raw value or timestamp.
+
+        Returns:
+            Voltage at the ADC pin in volts
+        """
+        return self.channel.voltage
+
     def is_pressed(self, threshold: float = 0.5) -> bool:
         """
         Check if sensor detects pressure above threshold.
@@ -111,7 +144,59 @@ class FSRSensor:
         Returns:
             True if pressed, False otherwise
         """
-        return self.channel.voltage > threshold
+        return self.read_voltage_only() > threshold
+
+
+class _RawADS1115:
+    """
+    Minimal raw-register ADS1115 reader over smbus2.
+
+    Bypasses the CircuitPython property stack on the sampling hot path:
+    once a channel's MUX config is latched, each sample is a single
+    two-byte read of the conversion register.
+    """
+
+    _CONVERSION_REG = 0x00
+    _CONFIG_REG = 0x01
+    # PGA +/-4.096 V, continuous mode, 860 SPS, comparator disabled
+    _CONFIG_BASE = (1 << 9) | (7 << 5) | 0x03
+
+    def __init__(self, bus, address: int):
+        self._bus = bus
+        self._address = address
+        self._config = -1  # Last latched config word
+
+    def read(self, channel: int) -> int:
+        """Read the latest conversion for an input channel (0-3)"""
+        config = self._CONFIG_BASE | ((4 | channel) << 12)
+        if config != self._config:
+            # MUX change - rewrite config and let the converter settle
+            self._bus.write_i2c_block_data(
+                self._address, self._CONFIG_REG,
+                [config >> 8, config & 0xFF])
+            self._config = config
+            time.sleep(0.0024)  # Two conversion periods at 860 SPS
+
+        hi, lo = self._bus.read_i2c_block_data(
+            self._address, self._CONVERSION_REG, 2)
+        value = (hi << 8) | lo
+        return value - 65536 if value & 0x8000 else value
+
+
+class _SMBusAnalogIn:
+    """AnalogIn-compatible view of one _RawADS1115 input channel"""
+
+    def __init__(self, raw_ads: _RawADS1115, channel: int):
+        self._raw = raw_ads
+        self._channel = channel
+
+    @property
+    def value(self) -> int:
+        return self._raw.read(self._channel)
+
+    @property
+    def voltage(self) -> float:
+        return self._raw.read(self._channel) * _ADC_VOLTS_PER_COUNT
 
 
 class TactileSensorArray:
@@ -120,16 +205,56 @@ class TactileSensorArray:
     Uses ADS1115 16-bit ADC to read up to 4 FSR sensors.
     """
     
-    def __init__(self, i2c_address: int = 0x48):
+    # A cached sweep older than one 50 Hz control tick is refreshed
+    _MAX_AGE_NS = 20_000_000
+
+    def __init__(self, i2c_address: int = 0x48, use_smbus: bool = False):
         """
         Initialize tactile sensor array with ADS1115.
         
         Args:
             i2c_address: I2C address of ADS1115 (default 0x48)
+            use_smbus: Read the ADC through raw smbus2 register access
+                       instead of the Adafruit driver (faster per
+                       sample; falls back if smbus2 is missing)
         """
+        self.sensors: Dict[str, FSRSensor] = {}
+
+        # Preallocated buffers for the vectorized fast path - filled in
+        # place so the control loop allocates nothing per read
+        self._sensor_ids: List[str] = []
+        self._raw = np.empty(4, dtype=np.int32)
+        self._volts = np.empty(4, dtype=np.float32)
+        self._forces = np.empty(4, dtype=np.float32)
+        self._baseline_v = np.zeros(4, dtype=np.float32)
+        self._calib_mask = np.zeros(4, dtype=np.bool_)
+        self._latest_ts = 0  # monotonic_ns of the last ADC sweep
+
+        if use_smbus:
+            try:
+                import smbus2
+                raw = _RawADS1115(smbus2.SMBus(1), i2c_address)
+                self.ads = None
+                self.channels = {ch: _SMBusAnalogIn(raw, ch)
+                                 for ch in range(4)}
+                logger.info(f"ADS1115 at 0x{i2c_address:02X} using raw "
+                            "smbus2 access")
+                return
+            except ImportError:
+                print("Warning: smbus2 not installed. Run: pip install smbus2 "
+                      "(falling back to Adafruit driver)")
+
         try:
-            i2c = busio.I2C(board.SCL, board.SDA)
+            # Fast-mode I2C - the ADS1115 supports 400 kHz. On a Pi
+            # this also needs i2c_arm_baudrate=400000 in /boot/config.txt
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
             self.ads = ADS.ADS1115(i2c, address=i2c_address)
+
+            # Continuous conversion at the chip's maximum rate - reads
+            # return the latest sample instead of triggering a
+            # single-shot conversion and waiting it out
+            self.ads.mode = ADS.Mode.CONTINUOUS
+            self.ads.data_rate = 860
             
             # Create analog input channels
             self.channels = {
@@ -139,8 +264,8 @@ class TactileSensorArray:
                 3: AnalogIn(self.ads, ADS.P3)
             }
             
-            self.sensors: Dict[str, FSRSensor] = {}
-            logger.info(f"ADS1115 initialized at address 0x{i2c_address:02X}")
+            logger.info(f"ADS1115 initialized at address 0x{i2c_address:02X} "
+                        "(I2C at 400kHz; ensure /boot/config.txt matches)")
             
         except Exception as e:
             logger.error(f"Failed to initialize ADS1115: {e}")
@@ -158,6 +283,7 @@ class TactileSensorArray:
             raise ValueError(f"Invalid channel: {channel}. Must be 0-3")
         
         self.sensors[sensor_id] = FSRSensor(self.channels[channel], sensor_id)
+        self._sensor_ids.append(sensor_id)
         logger.info(f"Added sensor '{sensor_id}' on channel {channel}")
     
     def calibrate_all(self) -> None:
@@ -165,6 +291,11 @@ class TactileSensorArray:
         logger.info("Calibrating all sensors...")
         for sensor_id, sensor in self.sensors.items():
             sensor.calibrate_baseline()
+
+        # Mirror the baselines into the fast-path arrays
+        for i, sensor_id in enumerate(self._sensor_ids):
+            self._baseline_v[i] = self.sensors[sensor_id]._baseline_voltage
+            self._calib_mask[i] = self.sensors[sensor_id].calibrated
     
     def read_sensor(self, sensor_id: str) -> Optional[FSRReading]:
         """
@@ -176,10 +307,20 @@ class TactileSensorArray:
         Returns:
             FSRReading or None if sensor not found
         """
-        if sensor_id in self.sensors:
-            return self.sensors[sensor_id].read()
-        logger.warning(f"Sensor '{sensor_id}' not found")
-        return None
+        if sensor_id not in self.sensors:
+            logger.warning(f"Sensor '{sensor_id}' not found")
+            return None
+
+        volts, forces = self._fresh_arrays()
+        i = self._sensor_ids.index(sensor_id)
+        return FSRReading(
+            sensor_id=sensor_id,
+            raw_value=int(self._raw[i]),
+            voltage=float(volts[i]),
+            force_estimate=float(forces[i]),
+            timestamp=(time.monotonic_ns()
+                       if self.sensors[sensor_id]._timestamp else 0)
+        )
     
     def read_all(self) -> Dict[str, FSRReading]:
         """
@@ -188,11 +329,68 @@ class TactileSensorArray:
         Returns:
             Dictionary of sensor readings
         """
+        volts, forces = self._fresh_arrays()
         readings = {}
-        for sensor_id, sensor in self.sensors.items():
-            readings[sensor_id] = sensor.read()
+        for i, sensor_id in enumerate(self._sensor_ids):
+            readings[sensor_id] = FSRReading(
+                sensor_id=sensor_id,
+                raw_value=int(self._raw[i]),
+                voltage=float(volts[i]),
+                force_estimate=float(forces[i]),
+                timestamp=(time.monotonic_ns()
+                           if self.sensors[sensor_id]._timestamp else 0)
+            )
         return readings
     
+    def read_all_fast(self):
+        """
+        Read all sensors into the preallocated arrays.
+
+        One channel read per sensor in Python; voltage scaling, force
+        estimation and clipping run vectorized over the whole array.
+        No FSRReading objects are constructed - callers that need them
+        should use read_all instead.
+
+        Returns:
+            (volts, forces) float32 array views, one entry per sensor
+            in add_sensor order
+        """
+        n = len(self._sensor_ids)
+        raw = self._raw[:n]
+        for i, sensor_id in enumerate(self._sensor_ids):
+            raw[i] = self.sensors[sensor_id].channel.value
+
+        volts = self._volts[:n]
+        np.multiply(raw, np.float32(_ADC_VOLTS_PER_COUNT), out=volts)
+
+        forces = self._forces[:n]
+        np.subtract(volts, self._baseline_v[:n], out=forces)
+        forces *= np.float32(20.0)
+        np.clip(forces, 0.0, 100.0, out=forces)
+        forces[~self._calib_mask[:n]] = 0.0  # Uncalibrated reads no force
+
+        self._latest_ts = time.monotonic_ns()
+        return volts, forces
+
+    def refresh(self) -> None:
+        """
+        Sweep the ADC once and cache the results.
+
+        Call once per control tick; check_grasp, get_grasp_force,
+        read_sensor and read_all then serve the cached sweep instead
+        of each doing their own conversions. A cache older than
+        _MAX_AGE_NS is refreshed automatically, so forgetting to call
+        this only costs one extra sweep, never stale data.
+        """
+        self.read_all_fast()
+
+    def _fresh_arrays(self):
+        """Cached (volts, forces) views, re-swept if stale"""
+        if time.monotonic_ns() - self._latest_ts > self._MAX_AGE_NS:
+            return self.read_all_fast()
+        n = len(self._sensor_ids)
+        return self._volts[:n], self._forces[:n]
+
     def check_grasp(self, required_sensors: List[str], 
                     threshold: float = 0.5) -> bool:
         """
@@ -205,15 +403,15 @@ class TactileSensorArray:
         Returns:
             True if all required sensors detect pressure
         """
+        indices = []
         for sensor_id in required_sensors:
             if sensor_id not in self.sensors:
                 logger.warning(f"Required sensor '{sensor_id}' not found")
                 return False
-            
-            if not self.sensors[sensor_id].is_pressed(threshold):
-                return False
-        
-        return True
+            indices.append(self._sensor_ids.index(sensor_id))
+
+        volts, _ = self._fresh_arrays()
+        return bool((volts[indices] > threshold).all())
     
     def get_grasp_force(self, sensor_ids: Optional[List[str]] = None) -> float:
         """
@@ -225,16 +423,14 @@ class TactileSensorArray:
         Returns:
             Total force estimate
         """
+        volts, forces = self._fresh_arrays()
+
         if sensor_ids is None:
-            sensor_ids = list(self.sensors.keys())
-        
-        total_force = 0.0
-        for sensor_id in sensor_ids:
-            if sensor_id in self.sensors:
-                reading = self.sensors[sensor_id].read()
-                total_force += reading.force_estimate
-        
-        return total_force
+            return float(forces.sum())
+
+        indices = [self._sensor_ids.index(s) for s in sensor_ids
+                   if s in self.sensors]
+        return float(forces[indices].sum())
 
 
 class ArtisanHandSensing: